@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class LocationsConfig(AppConfig):
+    name = "locations"
+
+    def ready(self):
+        # connect the signal receivers of the autocomplete index,
+        # so that every save is tracked, not only those of the server
+        from . import autocomplete  # noqa: F401
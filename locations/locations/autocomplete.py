@@ -0,0 +1,170 @@
+import bisect
+import heapq
+import threading
+import time
+import unicodedata
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import settings
+from .models import Location
+
+GENERATION_KEY = "locations_autocomplete_generation"
+
+
+def normalize(text: str) -> str:
+    """
+    Fold the given text for case and accent insensitive matching,
+    e.g. "Studentencafé" becomes "studentencafe".
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+class AutocompleteIndex:
+    """
+    An in-memory sorted array over the normalized location names.
+
+    Every word of a name is indexed, so that "ascii" suggests
+    "Studentencafé Ascii". The index is built lazily from the
+    database and kept up to date on location saves and deletes.
+
+    Each process holds its own index, so every change also bumps
+    a generation counter in the shared cache. The other processes
+    check the counter at most once per AUTOCOMPLETE_CHECK_INTERVAL
+    and rebuild their index, if it changed. As a fallback for changes
+    made without the signals, the index is rebuilt after a fixed time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = None
+        self._names = {}
+        self._generation = None
+        self._built_at = 0
+        self._checked_at = 0
+
+    @staticmethod
+    def _keys(name: str) -> list:
+        """
+        Compute the index entries of a name as (key, is_word_match)
+        tuples, where only the first entry matches the full name.
+        """
+        words = normalize(name).split()
+        return [(" ".join(words[i:]), i > 0) for i in range(len(words))]
+
+    def _is_stale(self) -> bool:
+        if self._entries is None:
+            return True
+        now = time.monotonic()
+        if now - self._built_at > settings.AUTOCOMPLETE_TTL:
+            return True
+        if now - self._checked_at < settings.AUTOCOMPLETE_CHECK_INTERVAL:
+            return False
+        self._checked_at = now
+        return cache.get(GENERATION_KEY, 0) != self._generation
+
+    def _bump_generation(self):
+        cache.add(GENERATION_KEY, 0, timeout=None)
+        generation = cache.incr(GENERATION_KEY)
+        # the own index is up to date, if no other process
+        # changed the locations in the meantime
+        if self._generation is not None and generation == self._generation + 1:
+            self._generation = generation
+
+    def _build(self):
+        # read the generation before the query, so that changes
+        # during the build trigger another rebuild
+        generation = cache.get(GENERATION_KEY, 0)
+
+        # build into local variables first, so that a failing query
+        # leaves the index unbuilt instead of empty
+        entries = []
+        names = {}
+        for location_id, name in Location.objects.values_list("id", "name"):
+            names[location_id] = name
+            entries.extend((key, location_id, is_word_match) for key, is_word_match in self._keys(name))
+        entries.sort()
+        self._entries = entries
+        self._names = names
+        self._generation = generation
+        self._built_at = self._checked_at = time.monotonic()
+
+    def _remove(self, location_id):
+        name = self._names.pop(location_id, None)
+        if name is None:
+            return
+        for key, is_word_match in self._keys(name):
+            entry = (key, location_id, is_word_match)
+            i = bisect.bisect_left(self._entries, entry)
+            if i < len(self._entries) and self._entries[i] == entry:
+                del self._entries[i]
+
+    def update(self, location_id, name: str):
+        """Insert or replace the name of the given location."""
+        with self._lock:
+            if self._entries is not None:
+                self._remove(location_id)
+                self._names[location_id] = name
+                for key, is_word_match in self._keys(name):
+                    bisect.insort(self._entries, (key, location_id, is_word_match))
+            self._bump_generation()
+
+    def remove(self, location_id):
+        """Remove the given location from the index."""
+        with self._lock:
+            if self._entries is not None:
+                self._remove(location_id)
+            self._bump_generation()
+
+    def suggest(self, prefix: str, limit: int) -> list:
+        """
+        Suggest at most limit locations, whose names contain
+        a word starting with the given prefix.
+
+        Full name matches are ranked before word matches
+        and shorter names before longer ones.
+        """
+        prefix = normalize(prefix).strip()
+        if not prefix:
+            return []
+
+        with self._lock:
+            if self._is_stale():
+                self._build()
+
+            matches = {}
+            i = bisect.bisect_left(self._entries, (prefix,))
+            while i < len(self._entries) and self._entries[i][0].startswith(prefix):
+                _, location_id, is_word_match = self._entries[i]
+                name = self._names[location_id]
+                rank = (is_word_match, len(name), name)
+                matches[location_id] = min(rank, matches.get(location_id, rank))
+                i += 1
+
+            ranked = heapq.nsmallest(limit, matches.items(), key=lambda item: item[1])
+            return [
+                {"id": location_id, "name": self._names[location_id]}
+                for location_id, _ in ranked
+            ]
+
+
+index = AutocompleteIndex()
+
+
+@receiver(post_save, sender=Location)
+def update_index(sender, instance, **kwargs):
+    # apply the change only once it is committed, so that other
+    # processes do not rebuild from an uncommitted state and rolled
+    # back changes do not end up in the index
+    location_id, name = instance.id, instance.name
+    transaction.on_commit(lambda: index.update(location_id, name))
+
+
+@receiver(post_delete, sender=Location)
+def remove_from_index(sender, instance, **kwargs):
+    location_id = instance.id
+    transaction.on_commit(lambda: index.remove(location_id))
@@ -0,0 +1,58 @@
+import json
+import zlib
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.forms import model_to_dict
+
+from .models import Location
+
+CHUNK_SIZE = 1000
+
+
+def _related_names(through, field: str, location_ids: list) -> dict:
+    """Resolve the many to many field names for a chunk of locations."""
+    names = {location_id: [] for location_id in location_ids}
+    rows = through.objects.filter(location_id__in=location_ids).values_list("location_id", field)
+    for location_id, name in rows:
+        names[location_id].append({"name": name})
+    return names
+
+
+def export_locations(chunk_size: int = CHUNK_SIZE):
+    """
+    Yield all locations as newline delimited json.
+
+    The locations are read through a server-side cursor and the
+    many to many fields are resolved per chunk, so that the memory
+    use does not grow with the number of locations.
+    """
+    locations = Location.objects.order_by("id").iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(locations, chunk_size))
+        if not chunk:
+            return
+
+        location_ids = [location.id for location in chunk]
+        categories = _related_names(Location.categories.through, "category_id", location_ids)
+        tags = _related_names(Location.tags.through, "tag_id", location_ids)
+
+        lines = []
+        for location in chunk:
+            # mirror the format of the location dict representation
+            location_dict = model_to_dict(location, exclude=["categories", "tags"])
+            location_dict["categories"] = categories[location.id]
+            location_dict["tags"] = tags[location.id]
+            lines.append(json.dumps(location_dict, cls=DjangoJSONEncoder) + "\n")
+
+        yield "".join(lines).encode()
+
+
+def gzip_stream(stream):
+    """Compress the given stream of bytes to a gzip stream."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for data in stream:
+        compressed = compressor.compress(data)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,40 @@
+import sys
+
+from django.core.management import BaseCommand, CommandError
+
+from locations.export import CHUNK_SIZE, export_locations, gzip_stream
+
+
+class Command(BaseCommand):
+    help = "Export all locations as newline delimited json."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            help="The file to write to, or - for binary stdout. Defaults to the command output."
+        )
+        parser.add_argument("--gzip", action="store_true", help="Compress the output with gzip, requires --output.")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        if options["gzip"] and not output:
+            raise CommandError("Compressed output requires --output.")
+
+        stream = export_locations(chunk_size=options["chunk_size"])
+        if options["gzip"]:
+            stream = gzip_stream(stream)
+
+        if output == "-":
+            for data in stream:
+                sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+        elif output:
+            with open(output, "wb") as f:
+                for data in stream:
+                    f.write(data)
+        else:
+            # write text through the command output to allow
+            # redirection, e.g. via call_command
+            for data in stream:
+                self.stdout.write(data.decode(), ending="")
@@ -51,12 +51,20 @@ class Location(models.Model):
         Compute the distance of the location to a given
         set of coordinates in meters.
         """
+        return Location.distance_between(self.latitude, self.longitude, latitude, longitude)
+
+    @staticmethod
+    def distance_between(lat_1, lon_1, lat_2, lon_2):
+        """
+        Compute the distance between two sets
+        of coordinates in meters.
+        """
         earth_radius = 6378137
 
-        lat_1 = math.radians(self.latitude)
-        lon_1 = math.radians(self.longitude)
-        lat_2 = math.radians(latitude)
-        lon_2 = math.radians(longitude)
+        lat_1 = math.radians(lat_1)
+        lon_1 = math.radians(lon_1)
+        lat_2 = math.radians(lat_2)
+        lon_2 = math.radians(lon_2)
 
         d_lon = lon_2 - lon_1
         d_lat = lat_2 - lat_1
@@ -40,7 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
 
-    'locations'
+    'locations.apps.LocationsConfig'
 ]
 
 MIDDLEWARE = [
@@ -89,6 +89,19 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/2.2/ref/settings/#caches
+
+# The cache must be shared by all processes, because it is
+# used to invalidate the autocomplete index of every process
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', default='django.core.cache.backends.db.DatabaseCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', default='locations_cache'),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
 
@@ -131,6 +144,17 @@ DEFAULT_SEARCH_RADIUS = 10000
 
 MAX_RESULTS = 100
 
+MAX_NEARBY_PROBES = 500
+
+MAX_SUGGESTIONS = 10
+
+# Check the cache for changes of the autocomplete index
+# by other processes at most once in this amount of seconds
+AUTOCOMPLETE_CHECK_INTERVAL = 1
+
+# Rebuild the autocomplete index after this amount of seconds
+AUTOCOMPLETE_TTL = 300
+
 # Setup support for proxy headers
 USE_X_FORWARDED_HOST = True
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
\ No newline at end of file
@@ -23,6 +23,9 @@ urlpatterns = [
 
     path('locations/find/', views.find_locations, name="find_locations"),
     path('locations/nearby/', views.find_nearby_locations, name="find_nearby_locations"),
+    path('locations/nearby/batch/', views.find_nearby_locations_batch, name="find_nearby_locations_batch"),
+    path('locations/autocomplete/', views.autocomplete_locations, name="autocomplete_locations"),
+    path('locations/export/', views.export_all_locations, name="export_all_locations"),
     path('locations/get/<location_id>/', views.get_location, name="get_location"),
     path('locations/create/', views.create_location, name="create_location"),
     path('locations/edit/<location_id>/', views.edit_location, name="edit_location"),
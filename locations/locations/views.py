@@ -1,12 +1,15 @@
+import bisect
 import json
 from decimal import Decimal
 from json import JSONDecodeError
 
 import requests
 from django.db import IntegrityError
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 
 from . import settings
+from .autocomplete import index
+from .export import export_locations, gzip_stream
 from .models import Location, Tag, Category
 
 
@@ -163,6 +166,133 @@ def find_nearby_locations(request) -> JsonResponse:
     )
 
 
+def find_nearby_locations_batch(request) -> JsonResponse:
+    """Find locations near many given coordinates at once via POST."""
+
+    if request.method != "POST":
+        return IncorrectAccessMethod()
+
+    try:
+        data = json.loads(request.body)
+    except JSONDecodeError:
+        return MalformedJson()
+
+    probes = data.get("probes") if isinstance(data, dict) else None
+    if not isinstance(probes, list) or not probes:
+        return MalformedJson()
+
+    if len(probes) > settings.MAX_NEARBY_PROBES:
+        return ErroneousValue()
+
+    try:
+        probes = [
+            (
+                float(probe["latitude"]),
+                float(probe["longitude"]),
+                # the radius of each probe is optional
+                float(probe.get("radius", settings.DEFAULT_SEARCH_RADIUS)),
+            )
+            for probe in probes
+        ]
+    except (KeyError, ValueError, TypeError, AttributeError):
+        return ErroneousValue()
+
+    # compute the search bounds of every probe as
+    # (max_lat, max_lon, min_lat, min_lon) tuples
+    bounds = [
+        Location.search_bounds(radius, latitude=latitude, longitude=longitude)
+        for latitude, longitude, radius in probes
+    ]
+
+    # fetch all candidates within the combined bounding region
+    # in a single query, but only the fields needed for the assignment,
+    # sorted by latitude to look up the latitude window of each probe
+    candidates = list(Location.objects.filter(
+        latitude__gte=Decimal(min(b[2] for b in bounds)),
+        latitude__lte=Decimal(max(b[0] for b in bounds)),
+        longitude__gte=Decimal(min(b[3] for b in bounds)),
+        longitude__lte=Decimal(max(b[1] for b in bounds)),
+    ).order_by("latitude", "id").values_list("id", "latitude", "longitude"))
+    latitudes = [latitude for _, latitude, _ in candidates]
+
+    # assign the candidates to every probe whose own search bounds
+    # contain them, the same bounds a single nearby request uses
+    results = []
+    for (latitude, longitude, _), (max_lat, max_lon, min_lat, min_lon) in zip(probes, bounds):
+        start = bisect.bisect_left(latitudes, min_lat)
+        end = bisect.bisect_right(latitudes, max_lat)
+        matches = [
+            {
+                "distance": Location.distance_between(
+                    candidate_lat, candidate_lon, latitude, longitude
+                ),
+                # json object keys are strings, so reference
+                # the serialized locations by string ids
+                "location_id": str(location_id),
+            }
+            for location_id, candidate_lat, candidate_lon in candidates[start:end]
+            if min_lon <= candidate_lon <= max_lon
+        ]
+        # limit the results of each probe to the nearest ones
+        matches.sort(key=lambda match: match["distance"])
+        results.append(matches[:settings.MAX_RESULTS])
+
+    # serialize every matched location only once
+    location_ids = {match["location_id"] for matches in results for match in matches}
+    locations = Location.objects.filter(id__in=location_ids).prefetch_related("categories", "tags")
+
+    return SuccessResponse({
+        "locations": {
+            str(location.id): location.dict_representation
+            for location in locations
+        },
+        "results": results,
+    })
+
+
+def autocomplete_locations(request) -> JsonResponse:
+    """Suggest location names for a given prefix via GET."""
+
+    if request.method != "GET":
+        return IncorrectAccessMethod()
+
+    name = request.GET.get("name", "")
+
+    try:
+        # the limit query parameter is optional
+        limit = int(request.GET.get("limit", settings.MAX_SUGGESTIONS))
+    except (ValueError, TypeError):
+        return ErroneousValue()
+
+    if limit < 1:
+        return ErroneousValue()
+
+    return SuccessResponse(
+        index.suggest(name, min(limit, settings.MAX_SUGGESTIONS)),
+        safe=False
+    )
+
+
+def export_all_locations(request):
+    """Export all locations as newline delimited json via GET."""
+
+    if request.method != "GET":
+        return IncorrectAccessMethod()
+
+    stream = export_locations()
+
+    # the compression query parameter is optional
+    compression = request.GET.get("compression")
+    if compression is None:
+        return StreamingHttpResponse(stream, content_type="application/x-ndjson")
+    if compression != "gzip":
+        return ErroneousValue()
+
+    response = StreamingHttpResponse(gzip_stream(stream), content_type="application/x-ndjson")
+    response["Content-Encoding"] = "gzip"
+    return response
+
+
 def get_location(request, location_id) -> JsonResponse:
     """Get a location by its id via GET."""
 